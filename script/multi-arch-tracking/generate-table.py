@@ -6,38 +6,61 @@ This script scans PipelineRun YAML files in the konflux-central repository
 and generates a table showing which architectures each component supports.
 """
 
+import functools
+import io
+import json
+import math
+import os
+import re
 import sys
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Set, Optional
+from typing import Dict, FrozenSet, List, Set, Optional, TextIO, Union
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+    print("Warning: PyYAML was built without libyaml, falling back to the slower pure-Python "
+          "loader. Install libyaml-devel and reinstall PyYAML for faster parsing.", file=sys.stderr)
 
+# Below this many files, parsing in-process is faster than starting a process pool
+PARALLEL_PARSE_MIN_FILES = 1000
+PARALLEL_PARSE_CHUNKSIZE = 16
+
+# Bump when parse results change, so cached results from older versions are discarded
+PARSE_CACHE_VERSION = 2
+# Least recently used entries beyond this are dropped when the cache is saved
+PARSE_CACHE_MAX_ENTRIES = 10000
+
+
+@functools.lru_cache(maxsize=64)
 def normalize_architecture(platform: str) -> str:
     """
     Normalize platform string to architecture name.
 
     Strips prefixes like 'linux/', 'linux-extra-fast/', 'linux-m2xlarge/', etc.
-    and normalizes 'x86_64' to 'amd64'.
+    and normalizes 'x86_64' to 'amd64'. Results are cached and interned since
+    only a handful of distinct architectures exist.
 
     Examples:
         linux/x86_64 -> amd64
         linux-m2xlarge/arm64 -> arm64
         linux-extra-fast/amd64 -> amd64
     """
-    # Extract architecture after the last '/'
-    if '/' in platform:
-        arch = platform.split('/')[-1]
-    else:
-        arch = platform
+    # Extract architecture after the last '/' (the whole string if there is none)
+    arch = platform.rpartition('/')[2]
 
     # Normalize x86_64 to amd64
     if arch == 'x86_64':
         arch = 'amd64'
 
-    return arch
+    return sys.intern(arch)
 
 
+@functools.lru_cache(maxsize=2048)
 def extract_component_name(output_image: str) -> str:
     """
     Extract component name from output-image value.
@@ -56,78 +79,524 @@ def extract_component_name(output_image: str) -> str:
         name = output_image
 
     # Remove :{{target_branch}} or similar suffix
-    if ':' in name:
-        name = name.split(':')[0]
+    return name.partition(':')[0]
+
+
+# Params whose values are evaluated by the event walker
+_EXTRACTED_PARAMS = ('output-image', 'build-platforms')
+
+_STR_TAG = 'tag:yaml.org,2002:str'
+_RESOLVER = yaml.resolver.Resolver()
+# Implicit tags whose values SafeLoader always constructs without error
+_SAFE_IMPLICIT_TAGS = frozenset({_STR_TAG, 'tag:yaml.org,2002:bool', 'tag:yaml.org,2002:null'})
+# First characters of plain scalars that may resolve to any other tag
+_UNSAFE_PLAIN_STARTS = frozenset(
+    start for start, resolvers in _RESOLVER.yaml_implicit_resolvers.items()
+    if start is not None and any(tag not in _SAFE_IMPLICIT_TAGS for tag, _ in resolvers)
+)
+
+
+class _NeedsFullLoad(Exception):
+    """
+    Raised when the YAML uses something the event walker doesn't evaluate itself.
+    """
+
+
+def _checked_events(events):
+    """
+    Yield parser events, stopping at anything whose construction a full load checks.
+
+    Explicit tags (e.g. `!foo` or `!!int abc`) and plain scalars that resolve to
+    numbers, timestamps, merge or value keys can fail or change meaning during
+    construction, so documents using them anywhere are handed to the full load.
+    """
+    for event in events:
+        if isinstance(event, yaml.ScalarEvent):
+            if event.tag is None:
+                if (event.implicit[0] and event.value[:1] in _UNSAFE_PLAIN_STARTS and
+                        _RESOLVER.resolve(yaml.ScalarNode, event.value, event.implicit) not in _SAFE_IMPLICIT_TAGS):
+                    raise _NeedsFullLoad()
+            elif event.tag != '!':
+                raise _NeedsFullLoad()
+        elif isinstance(event, yaml.CollectionStartEvent) and event.tag not in (None, '!'):
+            raise _NeedsFullLoad()
+        yield event
+
+
+def _skip_node(events, event) -> None:
+    """
+    Consume the remaining events of the node that starts with `event`.
+    """
+    if not isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+        return
+    depth = 1
+    while depth:
+        event = next(events)
+        if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+            depth += 1
+        elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+            depth -= 1
+
+
+def _is_special_key(key) -> bool:
+    """
+    Whether a mapping key is something only a full load resolves.
+
+    Aliases and merge keys need the full document, and SafeLoader rejects
+    collection keys as unhashable.
+    """
+    return not isinstance(key, yaml.ScalarEvent) or key.value == '<<'
+
+
+def _scalar_str(event) -> str:
+    """
+    Return the value of a scalar event that resolves to a string.
+
+    Plain scalars such as `~`, `true` or `5` resolve to other types in a full
+    load, so they are handed over to it instead of being taken as strings.
+    """
+    if not isinstance(event, yaml.ScalarEvent):
+        raise _NeedsFullLoad()
+    tag = event.tag
+    if tag is None or tag == '!':
+        tag = _RESOLVER.resolve(yaml.ScalarNode, event.value, event.implicit)
+    if tag != _STR_TAG:
+        raise _NeedsFullLoad()
+    return event.value
+
+
+def _read_param(events) -> tuple[Optional[str], object]:
+    """
+    Read one `{name: ..., value: ...}` param mapping from the event stream.
+
+    The mapping start event must already be consumed. The value is only
+    evaluated for output-image and build-platforms: a string for scalars, a list
+    of strings for sequences, None if the value is missing.
+    """
+    name_event = None
+    value_events = None
+    for key in events:
+        if isinstance(key, yaml.MappingEndEvent):
+            break
+        if _is_special_key(key):
+            raise _NeedsFullLoad()
+        event = next(events)
+        key_name = key.value
+        # Duplicate keys overwrite earlier ones, as in a full load
+        if key_name == 'name':
+            name_event = event
+            _skip_node(events, event)
+        elif key_name == 'value':
+            if isinstance(event, yaml.SequenceStartEvent):
+                value_events = []
+                for item in events:
+                    if isinstance(item, yaml.SequenceEndEvent):
+                        break
+                    value_events.append(item)
+                    _skip_node(events, item)
+            else:
+                value_events = event
+                _skip_node(events, event)
+        else:
+            _skip_node(events, event)
+
+    if name_event is None:
+        return None, None
+    if isinstance(name_event, yaml.AliasEvent):
+        raise _NeedsFullLoad()
+    name = name_event.value if isinstance(name_event, yaml.ScalarEvent) else None
+    if name not in _EXTRACTED_PARAMS or value_events is None:
+        return name, None
+
+    if isinstance(value_events, list):
+        return name, [_scalar_str(item) for item in value_events]
+    return name, _scalar_str(value_events)
+
+
+def _read_params(events) -> tuple[Optional[str], List[str]]:
+    """
+    Read the spec.params sequence (start event already consumed).
+
+    Later params override earlier ones with the same name, as with a full load.
+    """
+    output_image = None
+    platforms = []
+    for item in events:
+        if isinstance(item, yaml.SequenceEndEvent):
+            break
+        if not isinstance(item, yaml.MappingStartEvent):
+            raise _NeedsFullLoad()
+        name, value = _read_param(events)
+        if name == 'output-image':
+            output_image = value
+        elif name == 'build-platforms':
+            if isinstance(value, str):
+                raise _NeedsFullLoad()
+            platforms = value or []
+    return output_image, platforms
+
+
+def _read_spec(events) -> tuple[Optional[str], List[str]]:
+    """
+    Read the spec mapping (start event already consumed) and return its params.
+    """
+    result = (None, [])
+    for key in events:
+        if isinstance(key, yaml.MappingEndEvent):
+            break
+        if _is_special_key(key):
+            raise _NeedsFullLoad()
+        event = next(events)
+        if key.value == 'params':
+            if not isinstance(event, yaml.SequenceStartEvent):
+                raise _NeedsFullLoad()
+            result = _read_params(events)
+        else:
+            _skip_node(events, event)
+    return result
+
+
+def _walk_document(events) -> tuple[Optional[str], List[str]]:
+    """
+    Event walker behind _extract_params_fast.
+    """
+    result = (None, [])
+
+    # Skip stream/document start; an empty stream has no document
+    root = None
+    for root in events:
+        if not isinstance(root, (yaml.StreamStartEvent, yaml.DocumentStartEvent)):
+            break
+    if isinstance(root, yaml.StreamEndEvent):
+        return result
+    if not isinstance(root, yaml.MappingStartEvent):
+        raise _NeedsFullLoad()
+
+    for key in events:
+        if isinstance(key, yaml.MappingEndEvent):
+            break
+        if _is_special_key(key):
+            raise _NeedsFullLoad()
+        event = next(events)
+        if key.value == 'spec':
+            if not isinstance(event, yaml.MappingStartEvent):
+                raise _NeedsFullLoad()
+            result = _read_spec(events)
+        else:
+            _skip_node(events, event)
+
+    # A second document is an error for a single-document load; let it report that
+    for event in events:
+        if isinstance(event, yaml.DocumentStartEvent):
+            raise _NeedsFullLoad()
+
+    return result
+
+
+def _extract_params_full(content: Union[bytes, str]) -> tuple[Optional[str], List[str]]:
+    """
+    Extract the output-image and build-platforms params from a fully loaded document.
+    """
+    data = yaml.load(content, Loader=SafeLoader)
 
-    return name
+    if not data or 'spec' not in data or 'params' not in data['spec']:
+        return None, []
+
+    output_image = None
+    platforms = []
+    for param in data['spec']['params']:
+        if param.get('name') == 'output-image':
+            output_image = param.get('value')
+        elif param.get('name') == 'build-platforms':
+            platforms = param.get('value', [])
+    return output_image, platforms
+
+
+def _extract_params_fast(content: Union[bytes, str]) -> tuple[Optional[str], List[str]]:
+    """
+    Extract the output-image and build-platforms params from PipelineRun YAML content.
+
+    Walks the YAML event stream down to spec.params instead of constructing the
+    whole document. Duplicate keys and params resolve last-wins, and syntax errors
+    anywhere in the document are still raised. Documents using aliases, merge keys,
+    collection keys, explicit tags or numeric and timestamp plain scalars anywhere,
+    or values that don't resolve to strings (e.g. `~` or `true`) where the walker
+    looks, are handed to a full load, so results match yaml.load.
+
+    Returns:
+        Tuple of (output_image, list of platforms)
+    """
+    try:
+        return _walk_document(_checked_events(yaml.parse(content, Loader=SafeLoader)))
+    except _NeedsFullLoad:
+        return _extract_params_full(content)
 
 
-def parse_pipelinerun_from_content(file_path: str, content: str) -> tuple[Optional[str], Set[str]]:
+def parse_pipelinerun_from_content(file_path: str, content: Union[bytes, str]) -> tuple[Optional[str], FrozenSet[str]]:
     """
     Parse PipelineRun YAML content and extract component name and architectures.
 
     Args:
         file_path: Path to the file (for error reporting only)
-        content: YAML content as string
+        content: YAML content as bytes or string (encoding is detected by the YAML parser)
 
     Returns:
         Tuple of (component_name, set of architectures)
     """
     try:
-        data = yaml.safe_load(content)
-
-        if not data or 'spec' not in data or 'params' not in data['spec']:
-            return None, set()
-
-        output_image = None
-        platforms = []
-
-        # Extract parameters
-        for param in data['spec']['params']:
-            if param.get('name') == 'output-image':
-                output_image = param.get('value')
-            elif param.get('name') == 'build-platforms':
-                platforms = param.get('value', [])
+        # Only two params are needed, so avoid building the full document tree
+        output_image, platforms = _extract_params_fast(content)
 
         if not output_image or not platforms:
-            return None, set()
+            return None, frozenset()
 
         # Extract component name
         component_name = extract_component_name(output_image)
 
         # Normalize architectures
-        architectures = {normalize_architecture(p) for p in platforms}
+        architectures = frozenset(map(normalize_architecture, platforms))
 
         return component_name, architectures
 
     except Exception as e:
         print(f"Warning: Error parsing {file_path}: {e}", file=sys.stderr)
-        return None, set()
+        return None, frozenset()
 
 
-def parse_pipelinerun(file_path: Path) -> tuple[Optional[str], Set[str]]:
+def read_pipelinerun_file(file_path: Path) -> Optional[bytes]:
     """
-    Parse a PipelineRun YAML file and extract component name and architectures.
+    Read a PipelineRun YAML file from the filesystem.
+
+    The raw bytes are returned undecoded; the YAML parser handles the encoding.
 
     Returns:
-        Tuple of (component_name, set of architectures)
+        File content as bytes, or None if the file could not be read
     """
     try:
-        with open(file_path, 'r') as f:
-            content = f.read()
-        return parse_pipelinerun_from_content(str(file_path), content)
+        with open(file_path, 'rb') as f:
+            return f.read()
     except Exception as e:
         print(f"Warning: Error reading {file_path}: {e}", file=sys.stderr)
-        return None, set()
+        return None
+
+
+def _parse_worker(item: tuple[str, bytes]) -> tuple[Optional[str], FrozenSet[str]]:
+    """
+    Parse a single (file_path, content) pair in a worker process.
+    """
+    file_path, content = item
+    return parse_pipelinerun_from_content(file_path, content)
+
+
+def _parse_items(items: List[tuple[str, bytes]]) -> List[tuple[Optional[str], FrozenSet[str]]]:
+    """
+    Parse (file_path, content) pairs, using a process pool only for large inputs.
+
+    A single file parses in well under a millisecond, so the pool only pays for
+    itself with many files. Workers are capped so each gets at least one chunk.
+    """
+    workers = min(os.cpu_count() or 1, math.ceil(len(items) / PARALLEL_PARSE_CHUNKSIZE))
+    if len(items) < PARALLEL_PARSE_MIN_FILES or workers <= 1:
+        return [_parse_worker(item) for item in items]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_parse_worker, items, chunksize=PARALLEL_PARSE_CHUNKSIZE))
+
+
+def parse_pipelineruns(items: List[tuple[str, bytes]], shas: Optional[List[str]] = None,
+                       cache: Optional[dict] = None) -> Dict[str, FrozenSet[str]]:
+    """
+    Parse PipelineRun contents, in parallel across CPU cores for large inputs.
+
+    Each file is independent, so with enough files YAML parsing is fanned out to
+    worker processes to avoid being serialized on the GIL. Results are consumed in
+    input order, so later files win for duplicate component names.
+
+    Args:
+        items: List of (file_path, content) pairs
+        shas: Git blob SHA of each item, used as cache key (optional)
+        cache: Dict mapping blob SHA to parse result (optional). Items whose SHA
+            is cached are not parsed again, and new results are added to it.
+            Only results with a component are cached, so files that failed to
+            parse are parsed (and warned about) again on every run. Entries used
+            by this run are moved to the end, so the dict stays in LRU order.
+
+    Returns:
+        Dict mapping component names to sets of architectures
+    """
+    use_cache = shas is not None and cache is not None
+    results = [None] * len(items)
+    pending = []
+    for i in range(len(items)):
+        if use_cache and shas[i] in cache:
+            results[i] = cache[shas[i]] = cache.pop(shas[i])
+        else:
+            pending.append(i)
+
+    parsed = _parse_items([items[i] for i in pending])
+    for i, result in zip(pending, parsed):
+        results[i] = result
+        component_name, architectures = result
+        if use_cache and component_name and architectures:
+            cache[shas[i]] = result
+
+    components = {}
+    for component_name, architectures in results:
+        if component_name and architectures:
+            components[component_name] = architectures
+    return components
+
+
+def default_parse_cache_path() -> Optional[Path]:
+    """
+    Get the parse cache location under $XDG_CACHE_HOME or ~/.cache.
+
+    Returns:
+        Path of the cache file, or None if no absolute cache directory is known
+    """
+    cache_home = os.environ.get('XDG_CACHE_HOME')
+    if cache_home and os.path.isabs(cache_home):
+        return Path(cache_home) / 'konflux-arch-table.json'
+
+    try:
+        home = Path.home()
+    except RuntimeError:
+        return None
+    # Without a home directory, '~' would resolve relative to the working directory
+    if not home.is_absolute():
+        return None
+    return home / '.cache' / 'konflux-arch-table.json'
+
+
+def load_parse_cache(cache_path: Path) -> dict:
+    """
+    Load cached parse results keyed by git blob SHA.
+
+    Blobs are content-addressed, so a cached entry never goes stale for its SHA.
+
+    Returns:
+        Dict mapping blob SHA to (component_name, set of architectures) in LRU
+        order, empty if the cache does not exist or cannot be read
+    """
+    try:
+        with open(cache_path, 'rb') as f:
+            data = json.load(f)
+        # Discard caches written by an incompatible version of this script
+        if not isinstance(data, dict) or data.get('version') != PARSE_CACHE_VERSION:
+            return {}
+        return {
+            sha: (component_name, frozenset(map(sys.intern, architectures)))
+            for sha, (component_name, architectures) in data['entries'].items()
+        }
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        print(f"Warning: Error reading cache file {cache_path}: {e}", file=sys.stderr)
+        return {}
+
+
+def save_parse_cache(cache_path: Path, cache: dict) -> None:
+    """
+    Write cached parse results keyed by git blob SHA.
+
+    Only the PARSE_CACHE_MAX_ENTRIES most recently used entries are kept, so the
+    file does not grow without bound as blobs change across branches.
+    """
+    entries = list(cache.items())[-PARSE_CACHE_MAX_ENTRIES:]
+    data = {
+        'version': PARSE_CACHE_VERSION,
+        'entries': {
+            sha: [component_name, sorted(architectures)]
+            for sha, (component_name, architectures) in entries
+        },
+    }
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so concurrent runs never see a partial cache
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        print(f"Warning: Error writing cache file {cache_path}: {e}", file=sys.stderr)
 
 
 def find_pipelinerun_files(base_dir: Path) -> List[Path]:
     """
     Find all PipelineRun YAML files in pipelineruns/*/.tekton/ directories.
+
+    Uses os.scandir rather than Path.glob, since only two fixed directory
+    levels need to be listed. Like glob, directories that are missing or can't
+    be read are skipped.
+    """
+    pipelineruns_dir = os.path.join(base_dir, 'pipelineruns')
+    found = []
+    try:
+        components = os.scandir(pipelineruns_dir)
+    except OSError:
+        return []
+
+    with components:
+        for component in components:
+            if not component.is_dir():
+                continue
+            try:
+                entries = os.scandir(os.path.join(component.path, '.tekton'))
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.name.endswith('.yaml') and entry.is_file():
+                        found.append((component.name, entry.name))
+
+    # Sort by path components, matching the ordering of sorted Path objects
+    found.sort()
+    return [base_dir / 'pipelineruns' / component / '.tekton' / name for component, name in found]
+
+
+def _index_config(config: dict) -> dict:
+    """
+    Precompute lookup structures derived from the configuration.
+
+    Adds private '_'-prefixed keys to the config dict so per-cell lookups in
+    get_cell_value don't have to scan the raw configuration every time.
+
+    Returns:
+        The same config dict, updated in place
+    """
+    accelerators = list(config.get('accelerator_incompatibility_rules', {}).keys())
+    if accelerators:
+        # One lookahead group per accelerator, tried in config order, so the first
+        # accelerator (in config order) contained anywhere in the name wins
+        config['_accelerator_regex'] = re.compile(
+            '|'.join(f'(?=.*?({re.escape(accelerator)}))' for accelerator in accelerators),
+            re.DOTALL
+        )
+    # Filled per component by is_accelerator_incompatible, once the regex above exists
+    config['_detected_accelerators'] = {}
+
+    # Index exceptions by (component, arch); the first matching entry wins.
+    # Cell values are static per exception, so format them once here.
+    exception_index = {}
+    for exception in config.get('exception', []):
+        exception['_cell_values'] = format_exception_cells(exception)
+        for arch in exception.get('architectures', []):
+            exception_index.setdefault((exception.get('component'), arch), exception)
+    config['_exception_index'] = exception_index
+
+    # Without any rules, get_cell_value can skip the exception/accelerator lookups
+    config['_has_rules'] = bool(config.get('exception')) or bool(config.get('accelerator_incompatibility_rules'))
+
+    return config
+
+
+def _ensure_indexed(config: dict) -> dict:
     """
-    pattern = "pipelineruns/*/.tekton/*.yaml"
-    files = list(base_dir.glob(pattern))
-    return sorted(files)
+    Index a config that did not come from load_config, such as one built by a caller.
+    """
+    if '_exception_index' not in config:
+        _index_config(config)
+    return config
 
 
 def load_config(config_path: Optional[Path]) -> dict:
@@ -137,6 +606,13 @@ def load_config(config_path: Optional[Path]) -> dict:
     Returns:
         Dict with 'accelerator_incompatibility_rules' and 'exception' keys
     """
+    return _index_config(_read_config(config_path))
+
+
+def _read_config(config_path: Optional[Path]) -> dict:
+    """
+    Read the raw TOML configuration, falling back to empty defaults.
+    """
     if not config_path or not config_path.exists():
         return {
             'accelerator_incompatibility_rules': {},
@@ -167,35 +643,6 @@ def load_config(config_path: Optional[Path]) -> dict:
         }
 
 
-def validate_git_branch(repo_dir: Path, branch: str) -> bool:
-    """
-    Validate that a git branch or ref exists in the repository.
-
-    Args:
-        repo_dir: Path to the git repository
-        branch: Branch name or git ref to validate
-
-    Returns:
-        True if the branch exists, False otherwise
-
-    Raises:
-        ValueError: If the directory is not a git repository or git is not available
-    """
-    try:
-        result = subprocess.run(
-            ['git', 'rev-parse', '--verify', branch],
-            cwd=repo_dir,
-            capture_output=True,
-            text=True,
-            check=False
-        )
-        return result.returncode == 0
-    except FileNotFoundError:
-        raise ValueError("git command not found. Please ensure git is installed.")
-    except Exception as e:
-        raise ValueError(f"Error validating git branch: {e}")
-
-
 def find_pipelinerun_files_from_git(repo_dir: Path, branch: str) -> List[str]:
     """
     Find all PipelineRun YAML files in a git branch.
@@ -208,10 +655,10 @@ def find_pipelinerun_files_from_git(repo_dir: Path, branch: str) -> List[str]:
         branch: Branch name or git ref to read from
 
     Returns:
-        Sorted list of file paths relative to repository root
+        List of file paths relative to repository root, sorted by path
 
     Raises:
-        ValueError: If git command fails
+        ValueError: If the branch does not exist or git command fails
     """
     try:
         # List all files in pipelineruns/ directory recursively
@@ -223,56 +670,124 @@ def find_pipelinerun_files_from_git(repo_dir: Path, branch: str) -> List[str]:
             check=True
         )
 
-        # Filter for files matching pattern: pipelineruns/*/.tekton/*.yaml
+        # Filter for files matching pattern: pipelineruns/*/.tekton/*.yaml.
+        # ls-tree -r lists entries in git's tree order, which for full paths is the
+        # same as plain string ordering, so the result is already sorted.
         all_files = result.stdout.strip().split('\n')
-        yaml_files = [
+        return [
             f for f in all_files
             if f and '/.tekton/' in f and f.endswith('.yaml')
         ]
 
-        return sorted(yaml_files)
-
     except subprocess.CalledProcessError as e:
         error_msg = e.stderr.strip() if e.stderr else str(e)
+        # ls-tree fails on its own for unknown refs, so no separate rev-parse is needed
+        if 'Not a valid object name' in error_msg or 'unknown revision' in error_msg:
+            raise ValueError(f"Git branch '{branch}' not found. Try 'git fetch origin'.")
         raise ValueError(f"Error listing files from git branch '{branch}': {error_msg}")
+    except FileNotFoundError:
+        raise ValueError("git command not found. Please ensure git is installed.")
     except Exception as e:
         raise ValueError(f"Unexpected error listing files from git: {e}")
 
 
-def read_file_from_git(repo_dir: Path, branch: str, file_path: str) -> str:
+class GitCatFileBatch:
     """
-    Read file content from a git branch without checking it out.
-
-    Uses git show to read the file content directly from the git object database.
-
-    Args:
-        repo_dir: Path to the git repository
-        branch: Branch name or git ref to read from
-        file_path: Path to the file relative to repository root
+    Read file contents from git through a single long-running `git cat-file --batch` process.
 
-    Returns:
-        File content as string
+    Spawning one `git show` per file is dominated by process startup overhead, so
+    objects are requested over stdin of one process instead.
 
-    Raises:
-        ValueError: If git command fails or file doesn't exist in branch
+    Usage:
+        with GitCatFileBatch(repo_dir) as batch:
+            content = batch.read(f"{branch}:{file_path}")
     """
-    try:
-        # Use git show to read file content
-        git_path = f"{branch}:{file_path}"
-        result = subprocess.run(
-            ['git', 'show', git_path],
-            cwd=repo_dir,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        return result.stdout
 
-    except subprocess.CalledProcessError as e:
-        error_msg = e.stderr.strip() if e.stderr else str(e)
-        raise ValueError(f"Error reading file '{file_path}' from git branch '{branch}': {error_msg}")
-    except Exception as e:
-        raise ValueError(f"Unexpected error reading file from git: {e}")
+    def __init__(self, repo_dir: Path):
+        self.repo_dir = repo_dir
+        self.process = None
+        # Set once git has exited, after which no further objects can be read
+        self.broken = False
+
+    def __enter__(self) -> 'GitCatFileBatch':
+        try:
+            self.process = subprocess.Popen(
+                ['git', 'cat-file', '--batch'],
+                cwd=self.repo_dir,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE
+            )
+        except FileNotFoundError:
+            raise ValueError("git command not found. Please ensure git is installed.")
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.process:
+            try:
+                self.process.stdin.close()
+            except BrokenPipeError:
+                # git already exited, nothing left to flush
+                pass
+            self.process.stdout.close()
+            self.process.wait()
+            self.process = None
+
+    def _unexpected_exit(self) -> ValueError:
+        self.broken = True
+        return ValueError("git cat-file exited unexpectedly")
+
+    def read(self, ref: str) -> bytes:
+        """
+        Read the content of a git object.
+
+        Args:
+            ref: Object name, typically "{branch}:{file_path}"
+
+        Returns:
+            File content as bytes
+
+        Raises:
+            ValueError: If the object is missing or git output is malformed
+        """
+        return self.read_object(ref)[1]
+
+    def read_object(self, ref: str) -> tuple[str, bytes]:
+        """
+        Read a git object along with its SHA.
+
+        Args:
+            ref: Object name, typically "{branch}:{file_path}"
+
+        Returns:
+            Tuple of (object SHA, file content as bytes)
+
+        Raises:
+            ValueError: If the object is missing, git output is malformed or git
+                has exited (in which case `broken` is set)
+        """
+        try:
+            self.process.stdin.write(ref.encode() + b'\n')
+            self.process.stdin.flush()
+        except BrokenPipeError:
+            raise self._unexpected_exit()
+
+        header = self.process.stdout.readline()
+        if not header:
+            raise self._unexpected_exit()
+
+        header = header.decode().rstrip('\n')
+        # Unknown objects are reported as "<ref> missing" or "<ref> ambiguous"
+        if header.endswith((' missing', ' ambiguous')):
+            raise ValueError(f"Error reading '{ref}' from git: {header.rsplit(' ', 1)[1]} object")
+
+        # Header format: "<sha> <type> <size>"
+        sha, _, size = header.split()
+        size = int(size)
+        # Content is followed by a trailing newline
+        data = self.process.stdout.read(size + 1)
+        if len(data) != size + 1:
+            raise self._unexpected_exit()
+        return sha, data[:size]
 
 
 def extract_issue_key(issue_url: str) -> str:
@@ -290,7 +805,7 @@ def extract_issue_key(issue_url: str) -> str:
 
     # Extract the part after /browse/
     if '/browse/' in issue_url:
-        return issue_url.split('/browse/')[-1]
+        return issue_url.rpartition('/browse/')[2]
 
     # If it's already just the key, return it
     if '-' in issue_url and not '/' in issue_url:
@@ -299,18 +814,46 @@ def extract_issue_key(issue_url: str) -> str:
     return "XXX"
 
 
-def detect_accelerator(component_name: str, accelerator_rules: dict) -> Optional[str]:
+def format_exception_cells(exception: dict) -> Dict[str, str]:
+    """
+    Build the cell value of an exception for every output format.
+
+    Args:
+        exception: Exception dict from the configuration
+
+    Returns:
+        Dict mapping output format ('markdown', 'jira', 'csv', 'text') to cell value
+    """
+    issue_url = exception.get('issue', '')
+    issue_key = extract_issue_key(issue_url)
+
+    if not issue_url or issue_key == 'XXX':
+        return {'markdown': issue_key, 'jira': issue_key, 'csv': issue_key, 'text': issue_key}
+
+    return {
+        'markdown': f'[{issue_key}]({issue_url})',
+        'jira': f'[{issue_key}|{issue_url}]',
+        'csv': f'=HYPERLINK("{issue_url}","{issue_key}")',
+        'text': issue_key,
+    }
+
+
+def detect_accelerator(component_name: str, config: dict) -> Optional[str]:
     """
     Detect which accelerator (if any) is used by a component based on its name.
 
+    Uses the precompiled accelerator regex from load_config, so all accelerator
+    keywords are matched in a single regex call. When several keywords are in
+    the name, the first one in config order wins.
+
     Returns:
         Accelerator name if detected, None otherwise
     """
-    component_lower = component_name.lower()
-    for accelerator in accelerator_rules.keys():
-        if accelerator in component_lower:
-            return accelerator
-    return None
+    accelerator_regex = _ensure_indexed(config).get('_accelerator_regex')
+    if accelerator_regex is None:
+        return None
+    match = accelerator_regex.match(component_name.lower())
+    return match.group(match.lastindex) if match else None
 
 
 def get_exception_for_arch(component_name: str, arch: str, config: dict) -> Optional[dict]:
@@ -325,12 +868,7 @@ def get_exception_for_arch(component_name: str, arch: str, config: dict) -> Opti
     Returns:
         Exception dict if found, None otherwise
     """
-    exceptions = config.get('exception', [])
-    for exception in exceptions:
-        if exception.get('component') == component_name:
-            if arch in exception.get('architectures', []):
-                return exception
-    return None
+    return _ensure_indexed(config)['_exception_index'].get((component_name, arch))
 
 
 def is_accelerator_incompatible(component_name: str, arch: str, config: dict) -> bool:
@@ -346,7 +884,13 @@ def is_accelerator_incompatible(component_name: str, arch: str, config: dict) ->
         True if accelerator incompatibility rule applies, False otherwise
     """
     accelerator_rules = config.get('accelerator_incompatibility_rules', {})
-    detected_accelerator = detect_accelerator(component_name, accelerator_rules)
+
+    # The detected accelerator only depends on the name, so remember it per component;
+    # this also means the name is lowercased once per component, not once per cell
+    detected_accelerators = _ensure_indexed(config)['_detected_accelerators']
+    if component_name not in detected_accelerators:
+        detected_accelerators[component_name] = detect_accelerator(component_name, config)
+    detected_accelerator = detected_accelerators[component_name]
 
     if detected_accelerator:
         incompatible_archs = accelerator_rules.get(detected_accelerator, [])
@@ -374,22 +918,16 @@ def get_cell_value(component_name: str, arch: str, built_archs: Set[str], config
     if arch in built_archs:
         return 'Y'
 
+    # Nothing else can apply when the config has no exceptions or accelerator rules
+    if not _ensure_indexed(config)['_has_rules']:
+        return ''
+
     # Check for specific exception first
     exception = get_exception_for_arch(component_name, arch, config)
     if exception:
-        # Get issue key from exception
-        issue_url = exception.get('issue', '')
-        issue_key = extract_issue_key(issue_url)
-
-        # Format based on output type
-        if output_format == 'markdown' and issue_url and issue_key != 'XXX':
-            return f'[{issue_key}]({issue_url})'
-        elif output_format == 'jira' and issue_url and issue_key != 'XXX':
-            return f'[{issue_key}|{issue_url}]'
-        elif output_format == 'csv' and issue_url and issue_key != 'XXX':
-            return f'=HYPERLINK("{issue_url}","{issue_key}")'
-        else:
-            return issue_key
+        # Formatted issue reference, precomputed by load_config
+        cell_values = exception['_cell_values']
+        return cell_values.get(output_format, cell_values['text'])
 
     # Check for accelerator incompatibility
     if is_accelerator_incompatible(component_name, arch, config):
@@ -399,17 +937,27 @@ def get_cell_value(component_name: str, arch: str, built_archs: Set[str], config
     return ''
 
 
-def generate_table(components: Dict[str, Set[str]], config: dict, output_format: str = 'markdown') -> str:
+def _markdown_display_text(cell_value: str) -> str:
     """
-    Generate architecture support table.
+    Return the visible text of a markdown cell value.
+
+    For markdown links like '[KEY](url)' only the link text is displayed.
+    """
+    if cell_value.startswith('[') and '](' in cell_value:
+        return cell_value[1:cell_value.index(']')]
+    return cell_value
+
+
+def generate_table_to(stream: TextIO, components: Dict[str, Set[str]], config: dict,
+                      output_format: str = 'markdown') -> None:
+    """
+    Write architecture support table to a stream, one line at a time.
 
     Args:
+        stream: Text stream to write the table to
         components: Dict mapping component names to sets of supported architectures
         config: Configuration dict with exceptions and accelerator rules
         output_format: 'markdown', 'csv', 'text', or 'jira'
-
-    Returns:
-        Formatted table as string
     """
     # Define architecture columns in order
     arch_columns = ['amd64', 'arm64', 'ppc64le', 's390x']
@@ -417,12 +965,19 @@ def generate_table(components: Dict[str, Set[str]], config: dict, output_format:
     # Sort components alphabetically
     sorted_components = sorted(components.items())
 
+    _ensure_indexed(config)
+    # Compute every cell exactly once; the format branches below only lay them out
+    cell_format = output_format if output_format in ('csv', 'jira', 'markdown') else 'text'
+    rows = [
+        (name, [get_cell_value(name, arch, archs, config, cell_format) for arch in arch_columns])
+        for name, archs in sorted_components
+    ]
+
     if output_format == 'csv':
-        lines = ['Component Image,amd64,arm64,ppc64le,s390x']
-        for name, archs in sorted_components:
+        stream.write('Component Image,amd64,arm64,ppc64le,s390x\n')
+        for name, cells in rows:
             row = [name]
-            for arch in arch_columns:
-                cell_value = get_cell_value(name, arch, archs, config, 'csv')
+            for cell_value in cells:
                 # Wrap cells containing formulas in quotes and escape internal quotes
                 if cell_value.startswith('='):
                     # Escape quotes by doubling them for CSV
@@ -430,72 +985,51 @@ def generate_table(components: Dict[str, Set[str]], config: dict, output_format:
                     row.append(f'"{escaped_value}"')
                 else:
                     row.append(cell_value)
-            lines.append(','.join(row))
-        return '\n'.join(lines)
+            stream.write(','.join(row) + '\n')
 
     elif output_format == 'jira':
-        lines = []
-
         # Header with || for Jira wiki markup
-        header = '|| Component Image || amd64 || arm64 || ppc64le || s390x ||'
-        lines.append(header)
+        stream.write('|| Component Image || amd64 || arm64 || ppc64le || s390x ||\n')
 
         # Rows with |
-        for name, archs in sorted_components:
-            row_data = [name]
-            for arch in arch_columns:
-                row_data.append(get_cell_value(name, arch, archs, config, 'jira'))
-            lines.append('| ' + ' | '.join(row_data) + ' |')
-
-        return '\n'.join(lines)
+        for name, cells in rows:
+            row_data = [name] + cells
+            stream.write('| ' + ' | '.join(row_data) + ' |\n')
 
     elif output_format == 'markdown':
         # Calculate column widths
         max_name_len = max(len(name) for name, _ in sorted_components) if sorted_components else 10
         max_name_len = max(max_name_len, len('Component Image'))
 
-        # Calculate max width for each architecture column
-        arch_widths = {}
-        for arch in arch_columns:
-            max_width = len(arch)
-            for name, archs in sorted_components:
-                cell_value = get_cell_value(name, arch, archs, config, 'markdown')
-                # For markdown links, the display width is just the link text part
-                if cell_value.startswith('[') and '](' in cell_value:
-                    display_text = cell_value.split(']')[0][1:]
-                    max_width = max(max_width, len(display_text))
-                else:
-                    max_width = max(max_width, len(cell_value))
-            arch_widths[arch] = max_width
-
-        # Build table
-        lines = []
+        # Calculate max width for each architecture column, using the
+        # display text of markdown links
+        arch_widths = [
+            max(len(arch), max((len(_markdown_display_text(cells[i])) for _, cells in rows), default=0))
+            for i, arch in enumerate(arch_columns)
+        ]
 
         # Header
         header_parts = [f"{'Component Image':<{max_name_len}}"]
-        for arch in arch_columns:
-            header_parts.append(f"{arch:^{arch_widths[arch]}}")
+        for arch, width in zip(arch_columns, arch_widths):
+            header_parts.append(f"{arch:^{width}}")
         header = '| ' + ' | '.join(header_parts) + ' |'
 
         # Separator
         sep_parts = ['-' * max_name_len]
-        for arch in arch_columns:
-            sep_parts.append('-' * arch_widths[arch])
+        for width in arch_widths:
+            sep_parts.append('-' * width)
         separator = '|' + '|'.join(f" {s} " for s in sep_parts) + '|'
 
-        lines.append(header)
-        lines.append(separator)
+        stream.write(header + '\n')
+        stream.write(separator + '\n')
 
         # Rows
-        for name, archs in sorted_components:
+        for name, cells in rows:
             row_parts = [name.ljust(max_name_len)]
-            for arch in arch_columns:
-                cell_value = get_cell_value(name, arch, archs, config, 'markdown')
+            for cell_value, width in zip(cells, arch_widths):
                 # Center the cell value
-                row_parts.append(f"{cell_value:^{arch_widths[arch]}}")
-            lines.append('| ' + ' | '.join(row_parts) + ' |')
-
-        return '\n'.join(lines)
+                row_parts.append(f"{cell_value:^{width}}")
+            stream.write('| ' + ' | '.join(row_parts) + ' |\n')
 
     else:  # text format
         # Calculate column widths
@@ -503,35 +1037,45 @@ def generate_table(components: Dict[str, Set[str]], config: dict, output_format:
         max_name_len = max(max_name_len, len('Component Image'))
 
         # Calculate max width for each architecture column
-        arch_widths = {}
-        for arch in arch_columns:
-            max_width = len(arch)
-            for name, archs in sorted_components:
-                cell_value = get_cell_value(name, arch, archs, config, 'text')
-                max_width = max(max_width, len(cell_value))
-            arch_widths[arch] = max_width
-
-        lines = []
+        arch_widths = [
+            max(len(arch), max((len(cells[i]) for _, cells in rows), default=0))
+            for i, arch in enumerate(arch_columns)
+        ]
 
         # Header
         header_parts = [f"{'Component Image':<{max_name_len}}"]
-        for arch in arch_columns:
-            header_parts.append(f"{arch:^{arch_widths[arch]}}")
+        for arch, width in zip(arch_columns, arch_widths):
+            header_parts.append(f"{arch:^{width}}")
         header = '  '.join(header_parts)
 
         separator = '-' * len(header)
-        lines.append(header)
-        lines.append(separator)
+        stream.write(header + '\n')
+        stream.write(separator + '\n')
 
         # Rows
-        for name, archs in sorted_components:
+        for name, cells in rows:
             row_parts = [f"{name:<{max_name_len}}"]
-            for arch in arch_columns:
-                cell_value = get_cell_value(name, arch, archs, config, 'text')
-                row_parts.append(f"{cell_value:^{arch_widths[arch]}}")
-            lines.append('  '.join(row_parts))
+            for cell_value, width in zip(cells, arch_widths):
+                row_parts.append(f"{cell_value:^{width}}")
+            stream.write('  '.join(row_parts) + '\n')
+
+
+def generate_table(components: Dict[str, Set[str]], config: dict, output_format: str = 'markdown') -> str:
+    """
+    Generate architecture support table.
+
+    Args:
+        components: Dict mapping component names to sets of supported architectures
+        config: Configuration dict with exceptions and accelerator rules
+        output_format: 'markdown', 'csv', 'text', or 'jira'
 
-        return '\n'.join(lines)
+    Returns:
+        Formatted table as string
+    """
+    buffer = io.StringIO()
+    generate_table_to(buffer, components, config, output_format)
+    # The table has no trailing newline
+    return buffer.getvalue()[:-1]
 
 
 def main():
@@ -586,6 +1130,12 @@ def main():
              'If specified, reads files from git without checking out the branch. '
              'If omitted, reads from the current filesystem.'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Do not use the cache of parsed git blobs when reading from --branch '
+             '(stored in $XDG_CACHE_HOME or ~/.cache)'
+    )
 
     args = parser.parse_args()
 
@@ -596,20 +1146,18 @@ def main():
     else:
         print(f"Configuration file {args.config} not found, using defaults", file=sys.stderr)
 
-    # Parse all files - use git strategy if branch specified, otherwise filesystem
-    components = {}
+    # Read all files - use git strategy if branch specified, otherwise filesystem
+    contents = []
+    shas = None
+    cache_path = None
+    cache = None
 
     if args.branch:
         # Git-based reading strategy
+        shas = []
         print(f"Reading PipelineRun files from git branch '{args.branch}'", file=sys.stderr)
 
-        # Validate branch exists
-        if not validate_git_branch(args.base_dir, args.branch):
-            print(f"Error: Git branch '{args.branch}' not found.", file=sys.stderr)
-            print(f"Tip: Run 'git fetch origin' to update remote branches.", file=sys.stderr)
-            sys.exit(1)
-
-        # Find files in git branch
+        # Find files in git branch (fails if the branch does not exist)
         try:
             file_paths = find_pipelinerun_files_from_git(args.base_dir, args.branch)
         except ValueError as e:
@@ -623,15 +1171,25 @@ def main():
 
         print(f"Found {len(file_paths)} PipelineRun files", file=sys.stderr)
 
-        # Read and parse each file from git
-        for file_path in file_paths:
-            try:
-                content = read_file_from_git(args.base_dir, args.branch, file_path)
-                component_name, architectures = parse_pipelinerun_from_content(file_path, content)
-                if component_name and architectures:
-                    components[component_name] = architectures
-            except ValueError as e:
-                print(f"Warning: {e}", file=sys.stderr)
+        # Read each file from git, keeping blob SHAs as cache keys
+        with GitCatFileBatch(args.base_dir) as batch:
+            for file_path in file_paths:
+                try:
+                    sha, content = batch.read_object(f"{args.branch}:{file_path}")
+                    contents.append((file_path, content))
+                    shas.append(sha)
+                except ValueError as e:
+                    if batch.broken:
+                        # No further files can be read once git has exited, so the table would be incomplete
+                        print(f"Error: {e} while reading '{file_path}'", file=sys.stderr)
+                        sys.exit(1)
+                    print(f"Warning: {e}", file=sys.stderr)
+
+        # Parse results of git blobs are cached across runs
+        if not args.no_cache:
+            cache_path = default_parse_cache_path()
+        if cache_path:
+            cache = load_parse_cache(cache_path)
 
     else:
         # Filesystem-based reading strategy (original behavior)
@@ -646,25 +1204,37 @@ def main():
 
         print(f"Found {len(files)} PipelineRun files", file=sys.stderr)
 
-        # Parse all files
+        # Read all files
         for file_path in files:
-            component_name, architectures = parse_pipelinerun(file_path)
-            if component_name and architectures:
-                components[component_name] = architectures
-
+            content = read_pipelinerun_file(file_path)
+            if content is not None:
+                contents.append((str(file_path), content))
+
+    # Parse all files
+    components = parse_pipelineruns(contents, shas, cache)
+    if cache is not None:
+        save_parse_cache(cache_path, cache)
     print(f"Parsed {len(components)} components", file=sys.stderr)
 
-    # Generate table
-    table = generate_table(components, config, args.format)
-
-    # Output
+    # Generate table, streaming it straight to the output
     if args.output:
         with open(args.output, 'w') as f:
-            f.write(table)
-            f.write('\n')
+            generate_table_to(f, components, config, args.format)
         print(f"Table written to {args.output}", file=sys.stderr)
+    elif hasattr(sys.stdout, 'buffer'):
+        # Encode straight into the binary stdout buffer, bypassing the text layer's own buffering
+        sys.stdout.flush()
+        # Keep the encoding and error handler of sys.stdout (locale, PYTHONIOENCODING)
+        stdout = io.TextIOWrapper(sys.stdout.buffer, encoding=sys.stdout.encoding,
+                                  errors=sys.stdout.errors, write_through=True)
+        try:
+            generate_table_to(stdout, components, config, args.format)
+        finally:
+            stdout.flush()
+            # Detach so closing the wrapper doesn't close sys.stdout
+            stdout.detach()
     else:
-        print(table)
+        generate_table_to(sys.stdout, components, config, args.format)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,538 @@
+"""Tests for multi-arch-tracking/generate-table.py."""
+
+import importlib.util
+import io
+import json
+import multiprocessing
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+SCRIPT = Path(__file__).parent / "multi-arch-tracking" / "generate-table.py"
+
+# The script name isn't a valid module name, so load it from its path. It is
+# registered in sys.modules so its functions can be pickled for forked pool
+# workers (see TestParseItems).
+_spec = importlib.util.spec_from_file_location("generate_table", SCRIPT)
+generate_table = importlib.util.module_from_spec(_spec)
+sys.modules["generate_table"] = generate_table
+_spec.loader.exec_module(generate_table)
+
+
+PARAMS = "spec:\n  params:\n"
+OUTPUT_IMAGE = "  - name: output-image\n    value: quay.io/rhoai/comp:{{target_branch}}\n"
+BUILD_PLATFORMS = (
+    "  - name: build-platforms\n"
+    "    value:\n"
+    "    - linux/x86_64\n"
+    "    - linux-m2xlarge/arm64\n"
+)
+
+
+def full_load_params(content):
+    """Reference implementation: the params as seen by yaml.safe_load."""
+    data = yaml.safe_load(content)
+    if not data or "spec" not in data or "params" not in data["spec"]:
+        return None, []
+    output_image = None
+    platforms = []
+    for param in data["spec"]["params"]:
+        if param.get("name") == "output-image":
+            output_image = param.get("value")
+        elif param.get("name") == "build-platforms":
+            platforms = param.get("value", [])
+    return output_image, platforms
+
+
+# Documents the event walker must resolve exactly like a full load
+MATCHES_FULL_LOAD = {
+    "basic": PARAMS + OUTPUT_IMAGE + BUILD_PLATFORMS,
+    "swapped_params": PARAMS + BUILD_PLATFORMS + OUTPUT_IMAGE,
+    "value_before_name": PARAMS + "  - value: quay.io/rhoai/vf\n    name: output-image\n" + BUILD_PLATFORMS,
+    "flow_style": (
+        "spec: {params: [{name: output-image, value: 'quay.io/rhoai/f:1'},"
+        " {name: build-platforms, value: [linux/amd64]}]}"
+    ),
+    "empty_document": "",
+    "no_spec": "metadata:\n  name: x\n",
+    "no_params": "spec:\n  pipelineRef: {name: x}\n",
+    "spec_sequence": "spec: [1, 2]\n",
+    "alias_value": (
+        "x: &platforms [linux/s390x]\n" + PARAMS + OUTPUT_IMAGE
+        + "  - name: build-platforms\n    value: *platforms\n"
+    ),
+    "alias_name": "n: &n output-image\n" + PARAMS + "  - name: *n\n    value: quay.io/rhoai/na\n" + BUILD_PLATFORMS,
+    "merge_key": (
+        "base: &base\n  params:\n" + OUTPUT_IMAGE + BUILD_PLATFORMS
+        + "spec:\n  <<: *base\n"
+    ),
+    "duplicate_spec": (
+        PARAMS + OUTPUT_IMAGE + BUILD_PLATFORMS
+        + "spec:\n  params:\n  - name: output-image\n    value: quay.io/rhoai/second\n" + BUILD_PLATFORMS
+    ),
+    "duplicate_params_key": (
+        PARAMS + OUTPUT_IMAGE + BUILD_PLATFORMS
+        + "  params:\n  - name: output-image\n    value: quay.io/rhoai/second\n" + BUILD_PLATFORMS
+    ),
+    "duplicate_param": PARAMS + OUTPUT_IMAGE + BUILD_PLATFORMS + "  - name: output-image\n    value: quay.io/rhoai/later\n",
+    "null_output_image": PARAMS + "  - name: output-image\n    value: ~\n" + BUILD_PLATFORMS,
+    "bool_output_image": PARAMS + "  - name: output-image\n    value: true\n" + BUILD_PLATFORMS,
+    "quoted_bool_output_image": PARAMS + "  - name: output-image\n    value: 'true'\n" + BUILD_PLATFORMS,
+    "str_tagged_output_image": PARAMS + "  - name: output-image\n    value: !!str 5\n" + BUILD_PLATFORMS,
+    "missing_output_image_value": PARAMS + "  - name: output-image\n" + BUILD_PLATFORMS,
+    "missing_platforms_value": PARAMS + OUTPUT_IMAGE + "  - name: build-platforms\n",
+    "unrelated_bool_param": PARAMS + OUTPUT_IMAGE + "  - name: hermetic\n    value: true\n" + BUILD_PLATFORMS,
+    "unrelated_int": "metadata:\n  retries: 3\n" + PARAMS + OUTPUT_IMAGE + BUILD_PLATFORMS,
+    "unrelated_str_tag": "metadata: !!str 3\n" + PARAMS + OUTPUT_IMAGE + BUILD_PLATFORMS,
+}
+
+# Documents a full load rejects although the walker would not look at the bad part
+FULL_LOAD_ERRORS = {
+    "collection_key_in_spec": "spec:\n  ? [a, b]\n  : c\n  params:\n" + OUTPUT_IMAGE + BUILD_PLATFORMS,
+    "collection_key_in_param": PARAMS + "  - ? {a: b}\n    : c\n    name: output-image\n" + BUILD_PLATFORMS,
+    "collection_key_at_root": "? [a]\n: c\n" + PARAMS + OUTPUT_IMAGE + BUILD_PLATFORMS,
+    "unknown_tag": "metadata: !foo bar\n" + PARAMS + OUTPUT_IMAGE + BUILD_PLATFORMS,
+    "bad_int_tag": "metadata: !!int abc\n" + PARAMS + OUTPUT_IMAGE + BUILD_PLATFORMS,
+    "bad_timestamp": "metadata:\n  created: 2001-02-30\n" + PARAMS + OUTPUT_IMAGE + BUILD_PLATFORMS,
+}
+
+
+def walk(content):
+    """Run the event walker alone, without the full load fallback."""
+    events = yaml.parse(content, Loader=generate_table.SafeLoader)
+    return generate_table._walk_document(generate_table._checked_events(events))
+
+
+class TestExtractParamsFast:
+    @pytest.mark.parametrize("content", MATCHES_FULL_LOAD.values(), ids=MATCHES_FULL_LOAD.keys())
+    def test_matches_full_load(self, content):
+        assert generate_table._extract_params_fast(content) == full_load_params(content)
+
+    def test_accepts_bytes(self):
+        content = PARAMS + OUTPUT_IMAGE + BUILD_PLATFORMS
+        assert generate_table._extract_params_fast(content.encode()) == full_load_params(content)
+
+    def test_duplicates_resolve_last_wins(self):
+        content = MATCHES_FULL_LOAD["duplicate_param"]
+        assert generate_table._extract_params_fast(content)[0] == "quay.io/rhoai/later"
+
+    def test_unrelated_bool_param_stays_on_event_walker(self):
+        content = MATCHES_FULL_LOAD["unrelated_bool_param"]
+        assert walk(content) == full_load_params(content)
+
+    @pytest.mark.parametrize("name", ["alias_value", "merge_key", "null_output_image", "unrelated_int"])
+    def test_falls_back_to_full_load(self, name):
+        with pytest.raises(generate_table._NeedsFullLoad):
+            walk(MATCHES_FULL_LOAD[name])
+
+    @pytest.mark.parametrize("content", FULL_LOAD_ERRORS.values(), ids=FULL_LOAD_ERRORS.keys())
+    def test_full_load_errors_are_raised(self, content):
+        with pytest.raises(Exception) as full_load_error:
+            yaml.safe_load(content)
+        with pytest.raises(full_load_error.type):
+            generate_table._extract_params_fast(content)
+
+    @pytest.mark.parametrize("content", [
+        PARAMS + OUTPUT_IMAGE + BUILD_PLATFORMS + "foo: [1, 2\n",
+        PARAMS + OUTPUT_IMAGE + BUILD_PLATFORMS + "---\nx: 1\n",
+    ], ids=["late_syntax_error", "multiple_documents"])
+    def test_errors_after_params_are_raised(self, content):
+        with pytest.raises(yaml.YAMLError):
+            generate_table._extract_params_fast(content)
+
+
+class TestParsePipelinerunFromContent:
+    def test_component_and_architectures(self):
+        content = PARAMS + OUTPUT_IMAGE + BUILD_PLATFORMS
+        assert generate_table.parse_pipelinerun_from_content("f.yaml", content) == (
+            "comp", frozenset({"amd64", "arm64"})
+        )
+
+    def test_null_output_image_is_skipped(self):
+        content = MATCHES_FULL_LOAD["null_output_image"]
+        assert generate_table.parse_pipelinerun_from_content("f.yaml", content) == (None, frozenset())
+
+    def test_parse_error_warns(self, capsys):
+        content = PARAMS + OUTPUT_IMAGE + BUILD_PLATFORMS + "foo: [1, 2\n"
+        assert generate_table.parse_pipelinerun_from_content("f.yaml", content) == (None, frozenset())
+        assert "Warning: Error parsing f.yaml" in capsys.readouterr().err
+
+
+class TestParseCache:
+    CONTENT = PARAMS + OUTPUT_IMAGE + BUILD_PLATFORMS
+
+    def test_save_and_load_round_trip(self, tmp_path):
+        path = tmp_path / "sub" / "cache.json"
+        cache = {"sha1": ("comp", frozenset({"amd64", "arm64"}))}
+        generate_table.save_parse_cache(path, cache)
+        assert generate_table.load_parse_cache(path) == cache
+
+    def test_missing_file_is_empty(self, tmp_path, capsys):
+        assert generate_table.load_parse_cache(tmp_path / "cache.json") == {}
+        assert capsys.readouterr().err == ""
+
+    def test_version_mismatch_is_discarded(self, tmp_path):
+        path = tmp_path / "cache.json"
+        path.write_text(json.dumps({
+            "version": generate_table.PARSE_CACHE_VERSION - 1,
+            "entries": {"sha1": ["comp", ["amd64"]]},
+        }))
+        assert generate_table.load_parse_cache(path) == {}
+
+    @pytest.mark.parametrize("text", [
+        "not json",
+        json.dumps({"version": generate_table.PARSE_CACHE_VERSION}),
+        json.dumps({"version": generate_table.PARSE_CACHE_VERSION, "entries": {"sha1": "comp"}}),
+    ])
+    def test_bad_file_warns(self, tmp_path, capsys, text):
+        path = tmp_path / "cache.json"
+        path.write_text(text)
+        assert generate_table.load_parse_cache(path) == {}
+        assert "Warning: Error reading cache file" in capsys.readouterr().err
+
+    def test_save_keeps_most_recent_entries(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(generate_table, "PARSE_CACHE_MAX_ENTRIES", 2)
+        path = tmp_path / "cache.json"
+        cache = {sha: ("comp", frozenset({"amd64"})) for sha in ("sha1", "sha2", "sha3")}
+        generate_table.save_parse_cache(path, cache)
+        assert list(generate_table.load_parse_cache(path)) == ["sha2", "sha3"]
+
+    def test_hits_skip_parsing_and_move_to_end(self):
+        cached = (sys.intern("cached"), frozenset({"amd64"}))
+        cache = {"sha1": cached, "sha2": ("other", frozenset({"arm64"}))}
+        components = generate_table.parse_pipelineruns([("f.yaml", self.CONTENT)], ["sha1"], cache)
+        assert components == {"cached": frozenset({"amd64"})}
+        assert list(cache) == ["sha2", "sha1"]
+
+    def test_successful_parse_is_cached(self):
+        cache = {}
+        generate_table.parse_pipelineruns([("f.yaml", self.CONTENT)], ["sha1"], cache)
+        assert cache == {"sha1": ("comp", frozenset({"amd64", "arm64"}))}
+
+    def test_failed_parse_is_not_cached(self, capsys):
+        cache = {}
+        content = self.CONTENT + "foo: [1, 2\n"
+        for _ in range(2):
+            assert generate_table.parse_pipelineruns([("f.yaml", content)], ["sha1"], cache) == {}
+            assert "Warning: Error parsing f.yaml" in capsys.readouterr().err
+        assert cache == {}
+
+
+class TestDefaultParseCachePath:
+    def test_xdg_cache_home(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert generate_table.default_parse_cache_path() == tmp_path / "konflux-arch-table.json"
+
+    def test_relative_xdg_cache_home_uses_home(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("XDG_CACHE_HOME", "relative")
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        assert generate_table.default_parse_cache_path() == tmp_path / ".cache" / "konflux-arch-table.json"
+
+    @pytest.mark.parametrize("home", [Path("~"), RuntimeError])
+    def test_no_home_disables_cache(self, monkeypatch, home):
+        def fake_home():
+            if home is RuntimeError:
+                raise RuntimeError("Could not determine home directory.")
+            return home
+
+        monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+        monkeypatch.setattr(Path, "home", fake_home)
+        assert generate_table.default_parse_cache_path() is None
+
+
+class TestFindPipelinerunFiles:
+    def test_unreadable_directories_are_skipped(self, tmp_path, monkeypatch):
+        for component in ("a", "b"):
+            tekton = tmp_path / "pipelineruns" / component / ".tekton"
+            tekton.mkdir(parents=True)
+            (tekton / "push.yaml").write_text("")
+        scandir = generate_table.os.scandir
+
+        def fake_scandir(path):
+            if str(path).endswith(str(Path("a", ".tekton"))):
+                raise PermissionError(13, "Permission denied", path)
+            return scandir(path)
+
+        monkeypatch.setattr(generate_table.os, "scandir", fake_scandir)
+        assert generate_table.find_pipelinerun_files(tmp_path) == [
+            tmp_path / "pipelineruns" / "b" / ".tekton" / "push.yaml"
+        ]
+
+    def test_unreadable_pipelineruns_dir_is_empty(self, tmp_path, monkeypatch):
+        def fake_scandir(path):
+            raise PermissionError(13, "Permission denied", path)
+
+        monkeypatch.setattr(generate_table.os, "scandir", fake_scandir)
+        assert generate_table.find_pipelinerun_files(tmp_path) == []
+
+
+class TestExceptions:
+    def test_unindexed_config_is_indexed_on_use(self):
+        # A config that did not come from load_config keeps its exceptions and rules
+        config = {
+            "accelerator_incompatibility_rules": {"cuda": ["s390x"]},
+            "exception": [{"component": "c", "architectures": ["arm64"], "issue": "https://x/browse/K-1"}],
+        }
+        assert generate_table.generate_table({"odh-cuda": {"amd64"}, "c": set()}, config, "csv") == (
+            "Component Image,amd64,arm64,ppc64le,s390x\n"
+            'c,,"=HYPERLINK(""https://x/browse/K-1"",""K-1"")",,\n'
+            "odh-cuda,Y,,,N/A"
+        )
+
+    def test_first_matching_exception_wins(self):
+        first = {"component": "c", "architectures": ["arm64"], "issue": "K-1"}
+        config = generate_table._index_config({"exception": [
+            first,
+            {"component": "c", "architectures": ["arm64", "s390x"], "issue": "K-2"},
+        ]})
+        assert generate_table.get_exception_for_arch("c", "arm64", config) is first
+        assert generate_table.get_exception_for_arch("c", "s390x", config)["issue"] == "K-2"
+        assert generate_table.get_exception_for_arch("c", "amd64", config) is None
+
+    @pytest.mark.parametrize("issue, expected", [
+        ("", {"markdown": "XXX", "jira": "XXX", "csv": "XXX", "text": "XXX"}),
+        ("https://x/browse/XXX", {"markdown": "XXX", "jira": "XXX", "csv": "XXX", "text": "XXX"}),
+        ("not a key", {"markdown": "XXX", "jira": "XXX", "csv": "XXX", "text": "XXX"}),
+        ("K-1", {
+            "markdown": "[K-1](K-1)",
+            "jira": "[K-1|K-1]",
+            "csv": '=HYPERLINK("K-1","K-1")',
+            "text": "K-1",
+        }),
+        ("https://x/browse/K-1", {
+            "markdown": "[K-1](https://x/browse/K-1)",
+            "jira": "[K-1|https://x/browse/K-1]",
+            "csv": '=HYPERLINK("https://x/browse/K-1","K-1")',
+            "text": "K-1",
+        }),
+    ])
+    def test_format_exception_cells(self, issue, expected):
+        assert generate_table.format_exception_cells({"issue": issue}) == expected
+
+
+class TestDetectAccelerator:
+    @staticmethod
+    def config(*accelerators):
+        return generate_table._index_config(
+            {"accelerator_incompatibility_rules": {accelerator: ["s390x"] for accelerator in accelerators}}
+        )
+
+    @pytest.mark.parametrize("accelerators, expected", [
+        (("openvino", "cpu"), "openvino"),
+        # Config order wins, not the longest or leftmost keyword in the name
+        (("cpu", "openvino"), "cpu"),
+    ])
+    def test_first_keyword_in_config_order_wins(self, accelerators, expected):
+        assert generate_table.detect_accelerator("odh-openvino-cpu", self.config(*accelerators)) == expected
+
+    def test_matches_lowercased_name(self):
+        assert generate_table.detect_accelerator("odh-CUDA-runtime", self.config("rocm", "cuda")) == "cuda"
+
+    def test_no_rules(self):
+        assert generate_table.detect_accelerator("odh-cuda", self.config()) is None
+        assert generate_table.detect_accelerator("odh-cuda", {}) is None
+
+    def test_no_match(self):
+        assert generate_table.detect_accelerator("odh-dashboard", self.config("cuda", "rocm")) is None
+
+    def test_empty_key_matches_without_marking_incompatible(self):
+        config = self.config("", "cuda")
+        assert generate_table.detect_accelerator("odh-cuda", config) == ""
+        assert not generate_table.is_accelerator_incompatible("odh-cuda", "s390x", config)
+
+    def test_unindexed_config(self):
+        config = {"accelerator_incompatibility_rules": {"cuda": ["s390x"]}}
+        assert generate_table.detect_accelerator("odh-cuda", config) == "cuda"
+        assert generate_table.is_accelerator_incompatible("odh-cuda", "s390x", config)
+        assert not generate_table.is_accelerator_incompatible("odh-cuda", "arm64", config)
+
+
+@pytest.fixture
+def git_repo(tmp_path):
+    """A git repository with two committed PipelineRun files."""
+    repo = tmp_path / "repo"
+    for component in ("a", "b"):
+        tekton = repo / "pipelineruns" / component / ".tekton"
+        tekton.mkdir(parents=True)
+        (tekton / "push.yaml").write_text(
+            PARAMS + f"  - name: output-image\n    value: quay.io/rhoai/{component}:1\n" + BUILD_PLATFORMS
+        )
+    for command in (["init", "-q"], ["add", "."], ["commit", "-q", "-m", "init"]):
+        subprocess.run(
+            ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *command],
+            cwd=repo, check=True
+        )
+    return repo
+
+
+class TestGitCatFileBatch:
+    def test_reads_blob_and_sha(self, git_repo):
+        path = "pipelineruns/a/.tekton/push.yaml"
+        expected_sha = subprocess.run(
+            ["git", "rev-parse", f"HEAD:{path}"], cwd=git_repo, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        with generate_table.GitCatFileBatch(git_repo) as batch:
+            assert batch.read_object(f"HEAD:{path}") == (expected_sha, (git_repo / path).read_bytes())
+            # Reading again on the same process works
+            assert batch.read(f"HEAD:{path}") == (git_repo / path).read_bytes()
+
+    def test_missing_object(self, git_repo):
+        with generate_table.GitCatFileBatch(git_repo) as batch:
+            with pytest.raises(ValueError, match="missing object"):
+                batch.read("HEAD:pipelineruns/c/.tekton/push.yaml")
+            assert not batch.broken
+            assert batch.read("HEAD:pipelineruns/b/.tekton/push.yaml")
+
+    def test_git_exit_marks_batch_broken(self, git_repo):
+        with generate_table.GitCatFileBatch(git_repo) as batch:
+            batch.process.kill()
+            batch.process.wait()
+            with pytest.raises(ValueError, match="exited unexpectedly"):
+                batch.read("HEAD:pipelineruns/a/.tekton/push.yaml")
+            assert batch.broken
+
+    def test_main_fails_when_git_exits(self, git_repo, tmp_path, monkeypatch, capsys):
+        read_object = generate_table.GitCatFileBatch.read_object
+
+        def read_then_exit(batch, ref):
+            # git exits after the first file has been read
+            result = read_object(batch, ref)
+            batch.process.kill()
+            batch.process.wait()
+            return result
+
+        monkeypatch.setattr(generate_table.GitCatFileBatch, "read_object", read_then_exit)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        monkeypatch.setattr(sys, "argv", [
+            "generate-table.py", "--base-dir", str(git_repo), "--branch", "HEAD",
+            "--config", str(tmp_path / "missing.toml"),
+        ])
+        with pytest.raises(SystemExit) as exit_info:
+            generate_table.main()
+        assert exit_info.value.code == 1
+        captured = capsys.readouterr()
+        assert captured.out == ""
+        assert "Error: git cat-file exited unexpectedly while reading 'pipelineruns/b/.tekton/push.yaml'" in captured.err
+
+
+TABLE_COMPONENTS = {
+    "odh-dashboard": {"amd64", "arm64", "ppc64le"},
+    "odh-cuda-runtime": {"amd64", "arm64"},
+    "odh-notebooks": {"amd64"},
+    "odh-unbuilt": set(),
+}
+
+
+def table_config():
+    return generate_table._index_config({
+        "accelerator_incompatibility_rules": {"cuda": ["ppc64le", "s390x"]},
+        "exception": [
+            {"component": "odh-dashboard", "architectures": ["s390x"],
+             "issue": "https://issues.redhat.com/browse/RHOAIENG-1"},
+            {"component": "odh-notebooks", "architectures": ["ppc64le"], "issue": "RHOAIENG-22"},
+            {"component": "odh-notebooks", "architectures": ["s390x"], "issue": ""},
+        ],
+    })
+
+
+# Covers URL, bare key and missing-issue exceptions, N/A accelerator cells and an unbuilt component
+GOLDEN_TABLES = {
+    "markdown": (
+        "| Component Image  | amd64 | arm64 |   ppc64le   |   s390x    |\n"
+        "| ---------------- | ----- | ----- | ----------- | ---------- |\n"
+        "| odh-cuda-runtime |   Y   |   Y   |     N/A     |    N/A     |\n"
+        "| odh-dashboard    |   Y   |   Y   |      Y      | [RHOAIENG-1](https://issues.redhat.com/browse/RHOAIENG-1) |\n"
+        "| odh-notebooks    |   Y   |       | [RHOAIENG-22](RHOAIENG-22) |    XXX     |\n"
+        "| odh-unbuilt      |       |       |             |            |"
+    ),
+    "csv": (
+        "Component Image,amd64,arm64,ppc64le,s390x\n"
+        "odh-cuda-runtime,Y,Y,N/A,N/A\n"
+        'odh-dashboard,Y,Y,Y,"=HYPERLINK(""https://issues.redhat.com/browse/RHOAIENG-1"",""RHOAIENG-1"")"\n'
+        'odh-notebooks,Y,,"=HYPERLINK(""RHOAIENG-22"",""RHOAIENG-22"")",XXX\n'
+        "odh-unbuilt,,,,"
+    ),
+    "jira": (
+        "|| Component Image || amd64 || arm64 || ppc64le || s390x ||\n"
+        "| odh-cuda-runtime | Y | Y | N/A | N/A |\n"
+        "| odh-dashboard | Y | Y | Y | [RHOAIENG-1|https://issues.redhat.com/browse/RHOAIENG-1] |\n"
+        "| odh-notebooks | Y |  | [RHOAIENG-22|RHOAIENG-22] | XXX |\n"
+        "| odh-unbuilt |  |  |  |  |"
+    ),
+    "text": (
+        "Component Image   amd64  arm64    ppc64le      s390x   \n"
+        "-------------------------------------------------------\n"
+        "odh-cuda-runtime    Y      Y        N/A         N/A    \n"
+        "odh-dashboard       Y      Y         Y       RHOAIENG-1\n"
+        "odh-notebooks       Y           RHOAIENG-22     XXX    \n"
+        "odh-unbuilt                                            "
+    ),
+}
+EMPTY_TABLES = {
+    "markdown": "| Component Image | amd64 | arm64 | ppc64le | s390x |\n| --------------- | ----- | ----- | ------- | ----- |",
+    "csv": "Component Image,amd64,arm64,ppc64le,s390x",
+    "jira": "|| Component Image || amd64 || arm64 || ppc64le || s390x ||",
+    "text": "Component Image  amd64  arm64  ppc64le  s390x\n---------------------------------------------",
+}
+
+
+class TestGenerateTable:
+    @pytest.mark.parametrize("output_format", GOLDEN_TABLES)
+    def test_golden_table(self, output_format):
+        assert generate_table.generate_table(TABLE_COMPONENTS, table_config(), output_format) == (
+            GOLDEN_TABLES[output_format]
+        )
+
+    @pytest.mark.parametrize("output_format", EMPTY_TABLES)
+    def test_no_components(self, output_format):
+        assert generate_table.generate_table({}, table_config(), output_format) == EMPTY_TABLES[output_format]
+
+    @pytest.mark.parametrize("output_format", GOLDEN_TABLES)
+    def test_stream_ends_with_newline(self, output_format):
+        # generate_table returns the streamed table without its final newline
+        stream = io.StringIO()
+        generate_table.generate_table_to(stream, TABLE_COMPONENTS, table_config(), output_format)
+        assert stream.getvalue() == GOLDEN_TABLES[output_format] + "\n"
+
+    def test_unknown_format_is_text(self):
+        assert generate_table.generate_table(TABLE_COMPONENTS, table_config(), "other") == GOLDEN_TABLES["text"]
+
+
+class TestParseItems:
+    @pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="needs fork")
+    def test_pool_matches_sequential(self, monkeypatch):
+        items = [
+            (f"{i}.yaml", (
+                PARAMS + f"  - name: output-image\n    value: quay.io/rhoai/c{i % 7}:1\n" + BUILD_PLATFORMS
+            ).encode())
+            for i in range(40)
+        ]
+        items.append(("bad.yaml", b"foo: [1, 2\n"))
+        sequential = generate_table._parse_items(items)
+
+        pools = []
+
+        class ForkPool(generate_table.ProcessPoolExecutor):
+            def __init__(self, max_workers):
+                # Workers of other start methods would have to import the script by module name
+                super().__init__(max_workers=max_workers, mp_context=multiprocessing.get_context("fork"))
+                pools.append(max_workers)
+
+        monkeypatch.setattr(generate_table, "ProcessPoolExecutor", ForkPool)
+        monkeypatch.setattr(generate_table, "PARALLEL_PARSE_MIN_FILES", 1)
+        monkeypatch.setattr(generate_table.os, "cpu_count", lambda: 8)
+        assert generate_table._parse_items(items) == sequential
+        # 41 items in chunks of 16 need 3 workers, even with 8 CPUs
+        assert pools == [3]
+
+    def test_small_inputs_are_parsed_in_process(self, monkeypatch):
+        def no_pool(*args, **kwargs):
+            raise AssertionError("process pool used")
+
+        monkeypatch.setattr(generate_table, "ProcessPoolExecutor", no_pool)
+        monkeypatch.setattr(generate_table.os, "cpu_count", lambda: 8)
+        content = (PARAMS + OUTPUT_IMAGE + BUILD_PLATFORMS).encode()
+        assert generate_table._parse_items([("f.yaml", content)] * 10) == [("comp", frozenset({"amd64", "arm64"}))] * 10